@@ -40,7 +40,9 @@ def replace(obj, **changes):
     :changes: an attribute:argument mapping that will replace instance variables
         on the current instance
     """
-    return type(obj)(**dict(asdict(obj), **changes))
+    kwargs = asdict(obj)
+    kwargs.update(changes)
+    return type(obj)(**kwargs)
 
 
 class Immutable:
@@ -8,17 +8,28 @@ import forge._immutable as immutable
 from forge._marker import _void, empty
 from forge._signature import (
     _TYPE_FINDITER_SELECTOR,
+    KEYWORD_ONLY,
+    POSITIONAL_ONLY,
+    VAR_KEYWORD,
+    VAR_POSITIONAL,
+    Factory,
     FParameter,
     FSignature,
     fsignature,
     findparam,
     _get_pk_string,
     get_context_parameter,
-    get_var_keyword_parameter,
-    get_var_positional_parameter,
 )
 from forge._utils import CallArguments
 
+# How Mapper delivers a (converted) argument to the private signature
+_MAP_ARGUMENT = 0
+"""e.g. f(a) -> g(a), or f(*args) -> g(*args)"""
+_MAP_VAR_KEYWORD_ITEM = 1
+"""e.g. f(a) -> g(**kwargs)"""
+_MAP_VAR_KEYWORD = 2
+"""e.g. f(**kwargs) -> g(**kwargs)"""
+
 
 class Mapper(immutable.Immutable):
     """
@@ -29,6 +40,9 @@ class Mapper(immutable.Immutable):
         the public and private interface.
     :param callable: a callable that ultimately receives the arguments provided
         to public :class:`~forge.FSignature` interface.
+    :param private_signature: the :class:`inspect.Signature` of
+        :paramref:`~forge.Mapper.callable`, if it's already known (otherwise
+        it's retrieved with :func:`inspect.signature`)
 
     :ivar callable: see :paramref:`~forge._signature.Mapper.callable`
     :ivar fsignature: see :paramref:`~forge._signature.Mapper.fsignature`
@@ -49,19 +63,41 @@ class Mapper(immutable.Immutable):
         'parameter_map',
         'private_signature',
         'public_signature',
+        '_context_name',
+        '_public_positional',
+        '_public_keywords',
+        '_public_required',
+        '_public_defaults',
+        '_public_var_positional',
+        '_public_var_keyword',
+        '_private_positional',
+        '_private_keywords',
+        '_private_defaults',
+        '_private_var_positional',
+        '_private_var_keyword',
+        '_actions',
+        '_identity',
     )
 
     def __init__(
             self,
             fsignature: FSignature,
             callable: typing.Callable[..., typing.Any],
+            *,
+            private_signature: typing.Optional[inspect.Signature] = None
         ) -> None:
         # pylint: disable=W0622, redefined-builtin
         # pylint: disable=W0621, redefined-outer-name
-        private_signature = inspect.signature(callable)
+        if private_signature is None:
+            private_signature = inspect.signature(callable)
         public_signature = fsignature.native
         parameter_map = self.map_parameters(fsignature, private_signature)
         context_param = get_context_parameter(fsignature)
+        actions = self._get_actions(
+            fsignature,
+            private_signature,
+            parameter_map,
+        )
 
         super().__init__(
             callable=callable,
@@ -70,8 +106,187 @@ class Mapper(immutable.Immutable):
             private_signature=private_signature,
             public_signature=public_signature,
             parameter_map=parameter_map,
+            _context_name=context_param.name if context_param else None,
+            _actions=actions,
+            _identity=self._is_identity(
+                fsignature,
+                public_signature,
+                private_signature,
+                actions,
+            ),
+            **self._get_public_layout(public_signature),
+            **self._get_private_layout(private_signature)
         )
 
+    @staticmethod
+    def _get_public_layout(
+            public_signature: inspect.Signature
+        ) -> typing.Dict[str, typing.Any]:
+        """
+        Computes the layout of the public signature, used by
+        :meth:`~forge.Mapper._bind_public`.
+
+        :param public_signature: the native signature of
+            :paramref:`~forge.Mapper.fsignature`
+        :returns: a mapping of ``_public_*`` instance variables to values
+        """
+        positional, keywords, required, defaults = [], set(), [], []
+        var_positional = var_keyword = None
+        for param in public_signature.parameters.values():
+            if param.kind is VAR_POSITIONAL:
+                var_positional = param.name
+                continue
+            if param.kind is VAR_KEYWORD:
+                var_keyword = param.name
+                continue
+
+            if param.kind is not KEYWORD_ONLY:
+                positional.append(param.name)
+            if param.kind is not POSITIONAL_ONLY:
+                keywords.add(param.name)
+            if param.default is empty.native:
+                required.append(param.name)
+            else:
+                defaults.append((param.name, param.default))
+
+        return {
+            '_public_positional': tuple(positional),
+            '_public_keywords': frozenset(keywords),
+            '_public_required': tuple(required),
+            '_public_defaults': tuple(defaults),
+            '_public_var_positional': var_positional,
+            '_public_var_keyword': var_keyword,
+        }
+
+    @staticmethod
+    def _get_private_layout(
+            private_signature: inspect.Signature
+        ) -> typing.Dict[str, typing.Any]:
+        """
+        Computes the layout of the private signature, used by
+        :meth:`~forge.Mapper._map_arguments`.
+        Every private parameter either has a default or is mapped to
+        (see :meth:`~forge.Mapper.map_parameters`), so each receives a value on
+        every call.
+
+        :param private_signature: the signature of
+            :paramref:`~forge.Mapper.callable`
+        :returns: a mapping of ``_private_*`` instance variables to values
+        """
+        positional, keywords, defaults = [], [], {}
+        var_positional = var_keyword = None
+        for param in private_signature.parameters.values():
+            if param.kind is VAR_POSITIONAL:
+                var_positional = param.name
+                defaults[param.name] = ()
+                continue
+            if param.kind is VAR_KEYWORD:
+                # a fresh dict is provided on every call
+                var_keyword = param.name
+                continue
+
+            if param.kind is KEYWORD_ONLY:
+                keywords.append(param.name)
+            else:
+                positional.append(param.name)
+            if param.default is not empty.native:
+                defaults[param.name] = param.default
+
+        return {
+            '_private_positional': tuple(positional),
+            '_private_keywords': tuple(keywords),
+            '_private_defaults': defaults,
+            '_private_var_positional': var_positional,
+            '_private_var_keyword': var_keyword,
+        }
+
+    @staticmethod
+    def _get_actions(
+            fsignature: FSignature,
+            private_signature: inspect.Signature,
+            parameter_map: typing.Mapping[str, str],
+        ) -> typing.Tuple[typing.Tuple, ...]:
+        """
+        Computes how each parameter is delivered, used by
+        :meth:`~forge.Mapper._map_arguments`.
+        Passthrough parameters (no converters or validators, and neither
+        ``apply_conversion`` nor ``apply_validation`` overridden) only need
+        their default applied, so ``apply_default`` is called directly.
+
+        :param fsignature: see :paramref:`~forge.Mapper.fsignature`
+        :param private_signature: the signature of
+            :paramref:`~forge.Mapper.callable`
+        :param parameter_map: see :attr:`~forge.Mapper.parameter_map`
+        :returns: a tuple of ``(from_name, transform, passthrough, to_name,
+            action, interface_name)`` for each parameter of
+            :paramref:`~forge.Mapper.fsignature`
+        """
+        # pylint: disable=W0212, protected-access
+        # pylint: disable=W0621, redefined-outer-name
+        actions = []
+        for from_name, from_param in fsignature.parameters.items():
+            to_name = parameter_map[from_name]
+            if private_signature.parameters[to_name].kind is not VAR_KEYWORD:
+                action = _MAP_ARGUMENT
+            elif from_param.kind is VAR_KEYWORD:
+                action = _MAP_VAR_KEYWORD
+            else:
+                action = _MAP_VAR_KEYWORD_ITEM
+            passthrough = from_param._passthrough and \
+                type(from_param).__call__ is FParameter.__call__
+            actions.append((
+                from_name,
+                from_param.apply_default if passthrough else from_param,
+                passthrough,
+                to_name,
+                action,
+                from_param.interface_name,
+            ))
+        return tuple(actions)
+
+    @staticmethod
+    def _is_identity(
+            fsignature: FSignature,
+            public_signature: inspect.Signature,
+            private_signature: inspect.Signature,
+            actions: typing.Tuple[typing.Tuple, ...],
+        ) -> bool:
+        """
+        Determines whether the public signature is interchangeable with the
+        private signature: same names, kinds and defaults, with every parameter
+        a passthrough, and no keyword-only parameters.
+        If so, a successful bind of positional arguments alone, covering every
+        positional parameter, maps to those same arguments,
+        e.g. ``f(a, b=1) -> g(a, b=1)``.
+
+        :param fsignature: see :paramref:`~forge.Mapper.fsignature`
+        :param public_signature: the native signature of
+            :paramref:`~forge.Mapper.fsignature`
+        :param private_signature: the signature of
+            :paramref:`~forge.Mapper.callable`
+        :param actions: the result of :meth:`~forge.Mapper._get_actions`
+        :returns: whether arguments can be passed through unchanged
+        """
+        # pylint: disable=W0621, redefined-outer-name
+        public_params = list(public_signature.parameters.values())
+        private_params = list(private_signature.parameters.values())
+        return len(public_params) == len(fsignature) and \
+            len(public_params) == len(private_params) and \
+            all(
+                action[2] and  # passthrough
+                type(fparam).apply_default is FParameter.apply_default and
+                fparam.interface_name == fparam.name
+                for action, fparam in zip(actions, fsignature)
+            ) and \
+            all(
+                public.name == private.name and
+                public.kind is private.kind and
+                public.default is private.default and
+                public.kind is not KEYWORD_ONLY and
+                not isinstance(public.default, Factory)
+                for public, private in zip(public_params, private_params)
+            )
+
     def __call__(
             self,
             *args: typing.Any,
@@ -84,7 +299,8 @@ class Mapper(immutable.Immutable):
         Follows the strategy:
 
         #. bind the arguments to the :paramref:`~forge.Mapper.public_signature`
-        #. partialy bind the :paramref:`~forge.Mapper.private_signature`
+        #. start from the defaults of the \
+        :paramref:`~forge.Mapper.private_signature`
         #. identify the context argument (if one exists) from
         :class:`~forge.FParameter`s on the :class:`~forge.FSignature`
         #. iterate over the intersection of bound arguments and ``bound`` \
@@ -92,9 +308,9 @@ class Mapper(immutable.Immutable):
         :paramref:`~forge.Mapper.private_signature` of the \
         :paramref:`.Mapper.callable`, getting their transformed value by \
         calling :meth:`~forge.FParameter.__call__`
-        #. map the resulting value into the private_signature bound arguments
+        #. map the resulting value into the private_signature arguments
         #. generate and return a :class:`~forge._signature.CallArguments` from \
-        the private_signature bound arguments.
+        the private_signature arguments.
 
         :param args: the positional arguments to map
         :param kwargs: the keyword arguments to map
@@ -103,6 +319,180 @@ class Mapper(immutable.Immutable):
             :paramref:`~forge.Mapper.public_signature` to
             :paramref:`~forge.Mapper.private_signature`
         """
+        mapped_args, mapped_kwargs = self._map_arguments(args, kwargs)
+        return CallArguments(*mapped_args, **mapped_kwargs)
+
+    def _map_arguments(
+            self,
+            args: typing.Tuple[typing.Any, ...],
+            kwargs: typing.Dict[str, typing.Any],
+        ) -> typing.Tuple[typing.Tuple, typing.Dict[str, typing.Any]]:
+        """
+        Implements :meth:`~forge.Mapper.__call__`, returning the mapped
+        positional and keyword arguments as a tuple and a dict (rather than as
+        :class:`~forge._signature.CallArguments`).
+
+        :param args: the positional arguments to map
+        :param kwargs: the keyword arguments to map
+        :returns: the positional arguments and keyword arguments for the
+            :paramref:`~forge.Mapper.private_signature`
+        """
+        if self._can_pass_through(args, kwargs):
+            return args, {}
+
+        arguments = self._bind_public(args, kwargs)
+
+        # inlined ``get_context``
+        ctx = arguments[self._context_name] \
+            if self._context_name is not None \
+            else None
+
+        private_arguments = self._private_defaults.copy()
+        var_keyword = self._private_var_keyword
+        if var_keyword is not None:
+            private_arguments[var_keyword] = {}
+
+        for from_name, transform, passthrough, to_name, action, \
+                interface_name in self._actions:
+            from_val = arguments.get(from_name, empty)
+            to_val = transform(from_val) \
+                if passthrough \
+                else transform(ctx, from_val)
+
+            if action == _MAP_ARGUMENT:
+                # e.g. f(a) -> g(a), or f(*args) -> g(*args)
+                private_arguments[to_name] = to_val
+            elif action == _MAP_VAR_KEYWORD_ITEM:
+                # e.g. f(a) -> g(**kwargs)
+                private_arguments[to_name][interface_name] = to_val
+            else:
+                # e.g. f(**kwargs) -> g(**kwargs)
+                private_arguments[to_name].update(to_val)
+
+        return self._unpack_private(private_arguments)
+
+    def _can_pass_through(
+            self,
+            args: typing.Tuple[typing.Any, ...],
+            kwargs: typing.Dict[str, typing.Any],
+        ) -> bool:
+        """
+        Determines whether an identity mapping (see
+        :meth:`~forge.Mapper._is_identity`) can pass the arguments through
+        without binding them: every positional parameter is supplied, and
+        surplus arguments are collected by a var-positional parameter, so the
+        bind can't fail.
+
+        Keyword arguments or omitted defaults are normalized by the full
+        mapping, and :meth:`~forge.FParameter.apply_default` calls
+        :class:`~forge.Factory` argument values supplied for named parameters,
+        so those calls still take the long way round.
+
+        :param args: the positional arguments to map
+        :param kwargs: the keyword arguments to map
+        :returns: whether the arguments map to themselves
+        """
+        if not self._identity or kwargs:
+            return False
+        count = len(self._public_positional)
+        if len(args) < count or \
+                len(args) > count and self._public_var_positional is None:
+            return False
+        return not any(isinstance(value, Factory) for value in args[:count])
+
+    def _unpack_private(
+            self,
+            private_arguments: typing.Mapping[str, typing.Any],
+        ) -> typing.Tuple[typing.Tuple, typing.Dict[str, typing.Any]]:
+        """
+        Splits the arguments for the :paramref:`~forge.Mapper.private_signature`
+        into positional and keyword arguments, using the parameter layout
+        computed in :meth:`~forge.Mapper.__init__`.
+
+        :param private_arguments: a mapping of private parameter names to
+            argument values
+        :returns: the positional arguments and keyword arguments for the
+            :paramref:`~forge.Mapper.private_signature`
+        """
+        mapped_args = [
+            private_arguments[name] for name in self._private_positional
+        ]
+        if self._private_var_positional is not None:
+            mapped_args.extend(private_arguments[self._private_var_positional])
+
+        mapped_kwargs = {
+            name: private_arguments[name] for name in self._private_keywords
+        }
+        if self._private_var_keyword is not None:
+            mapped_kwargs.update(private_arguments[self._private_var_keyword])
+
+        return tuple(mapped_args), mapped_kwargs
+
+    def _bind_public(
+            self,
+            args: typing.Tuple[typing.Any, ...],
+            kwargs: typing.Dict[str, typing.Any],
+        ) -> typing.Mapping[str, typing.Any]:
+        """
+        Binds the arguments to the :paramref:`~forge.Mapper.public_signature`
+        and applies defaults, like :meth:`inspect.Signature.bind` followed by
+        :meth:`inspect.BoundArguments.apply_defaults`, but using the parameter
+        layout computed in :meth:`~forge.Mapper.__init__`.
+
+        Calls that can't be bound directly (e.g. missing, duplicate or
+        unexpected arguments) are handed to :meth:`~forge.Mapper._bind_native`
+        so they resolve (or raise) exactly as they would natively.
+
+        :param args: the positional arguments to bind
+        :param kwargs: the keyword arguments to bind
+        :returns: a mapping of parameter names to argument values
+        """
+        positional = self._public_positional
+        var_positional = self._public_var_positional
+        var_keyword = self._public_var_keyword
+        if len(args) > len(positional) and var_positional is None:
+            return self._bind_native(args, kwargs)
+
+        arguments = dict(zip(positional, args))
+        extra_kwargs = {}
+        for name, value in kwargs.items():
+            if name in self._public_keywords:
+                if name in arguments:
+                    return self._bind_native(args, kwargs)
+                arguments[name] = value
+            elif var_keyword is not None and name not in positional:
+                extra_kwargs[name] = value
+            else:
+                return self._bind_native(args, kwargs)
+
+        for name in self._public_required:
+            if name not in arguments:
+                return self._bind_native(args, kwargs)
+        for name, default in self._public_defaults:
+            if name not in arguments:
+                arguments[name] = default
+
+        if var_positional is not None:
+            arguments[var_positional] = args[len(positional):]
+        if var_keyword is not None:
+            arguments[var_keyword] = extra_kwargs
+        return arguments
+
+    def _bind_native(
+            self,
+            args: typing.Tuple[typing.Any, ...],
+            kwargs: typing.Dict[str, typing.Any],
+        ) -> typing.Mapping[str, typing.Any]:
+        """
+        Binds the arguments to the :paramref:`~forge.Mapper.public_signature`
+        using :meth:`inspect.Signature.bind`, and applies defaults.
+
+        :param args: the positional arguments to bind
+        :param kwargs: the keyword arguments to bind
+        :raises TypeError: if the arguments can't be bound; the message is
+            prefixed with the name of :paramref:`~forge.Mapper.callable`
+        :returns: a mapping of parameter names to argument values
+        """
         try:
             public_ba = self.public_signature.bind(*args, **kwargs)
         except TypeError as exc:
@@ -114,33 +504,7 @@ class Mapper(immutable.Immutable):
                 ),
             )
         public_ba.apply_defaults()
-
-        private_ba = self.private_signature.bind_partial()
-        private_ba.apply_defaults()
-        ctx = self.get_context(public_ba.arguments)
-
-        for from_name, from_param in self.fsignature.parameters.items():
-            from_val = public_ba.arguments.get(from_name, empty)
-            to_name = self.parameter_map[from_name]
-            to_param = self.private_signature.parameters[to_name]
-            to_val = self.fsignature.parameters[from_name](ctx, from_val)
-
-            if to_param.kind is FParameter.VAR_POSITIONAL:
-                # e.g. f(*args) -> g(*args)
-                private_ba.arguments[to_name] = to_val
-            elif to_param.kind is FParameter.VAR_KEYWORD:
-                if from_param.kind is FParameter.VAR_KEYWORD:
-                    # e.g. f(**kwargs) -> g(**kwargs)
-                    private_ba.arguments[to_name].update(to_val)
-                else:
-                    # e.g. f(a) -> g(**kwargs)
-                    private_ba.arguments[to_name]\
-                        [from_param.interface_name] = to_val
-            else:
-                # e.g. f(a) -> g(a)
-                private_ba.arguments[to_name] = to_val
-
-        return CallArguments.from_bound_arguments(private_ba)
+        return public_ba.arguments
 
     def __repr__(self) -> str:
         pubstr = str(self.public_signature)
@@ -183,21 +547,16 @@ class Mapper(immutable.Immutable):
             are mapped.
         '''
         # pylint: disable=W0622, redefined-builtin
-        from_vpo_param = get_var_positional_parameter(from_)
-        from_vkw_param = get_var_keyword_parameter(from_)
-        from_param_index = {
-            fparam.interface_name: fparam for fparam in from_
-            if fparam not in (from_vpo_param, from_vkw_param)
-        }
-
-        to_vpo_param = \
-            get_var_positional_parameter(to_.parameters.values())
-        to_vkw_param = \
-            get_var_keyword_parameter(to_.parameters.values())
-        to_param_index = {
-            param.name: param for param in to_.parameters.values()
-            if param not in (to_vpo_param, to_vkw_param)
-        }
+        from_vpo_param, from_vkw_param, from_param_index = \
+            Mapper._partition_parameters(
+                from_,
+                lambda fparam: fparam.interface_name,
+            )
+        to_vpo_param, to_vkw_param, to_param_index = \
+            Mapper._partition_parameters(
+                to_.parameters.values(),
+                lambda param: param.name,
+            )
 
         mapping = {}
         for name in list(to_param_index):
@@ -222,7 +581,7 @@ class Mapper(immutable.Immutable):
         if from_vpo_param:
             # invalid mapping, e.g. f(*args) -> g()
             if not to_vpo_param:
-                kind_repr = _get_pk_string(FParameter.VAR_POSITIONAL)
+                kind_repr = _get_pk_string(VAR_POSITIONAL)
                 raise TypeError(
                     "Missing requisite mapping from {kind_repr} parameter "
                     "'{from_vpo_param.name}'".\
@@ -234,7 +593,7 @@ class Mapper(immutable.Immutable):
         if from_vkw_param:
             # invalid mapping, e.g. f(**kwargs) -> g()
             if not to_vkw_param:
-                kind_repr = _get_pk_string(FParameter.VAR_KEYWORD)
+                kind_repr = _get_pk_string(VAR_KEYWORD)
                 raise TypeError(
                     "Missing requisite mapping from {kind_repr} parameter "
                     "'{from_vkw_param.name}'".\
@@ -257,6 +616,38 @@ class Mapper(immutable.Immutable):
 
         return types.MappingProxyType(mapping)
 
+    @staticmethod
+    def _partition_parameters(
+            parameters: typing.Iterable[typing.Any],
+            get_name: typing.Callable[[typing.Any], str],
+        ) -> typing.Tuple[
+            typing.Any,
+            typing.Any,
+            typing.Dict[str, typing.Any],
+        ]:
+        """
+        Partitions parameters in a single pass, for
+        :meth:`~forge.Mapper.map_parameters`.
+
+        :param parameters: an iterable of :class:`~forge.FParameter` or
+            :class:`inspect.Parameter`
+        :param get_name: a callable that returns the name a parameter is
+            matched by
+        :returns: the :term:`var-positional` parameter (or ``None``), the
+            :term:`var-keyword` parameter (or ``None``), and a mapping of
+            names to the remaining parameters
+        """
+        var_positional = var_keyword = None
+        index = {}
+        for param in parameters:
+            if param.kind is VAR_POSITIONAL:
+                var_positional = param
+            elif param.kind is VAR_KEYWORD:
+                var_keyword = param
+            else:
+                index[get_name(param)] = param
+        return var_positional, var_keyword, index
+
 
 class Revision:
     """
@@ -308,27 +699,44 @@ class Revision:
         """
         # pylint: disable=W0622, redefined-builtin
         if hasattr(callable, '__mapper__'):
+            private_signature = None
             next_ = self.revise(callable.__mapper__.fsignature)  # type: ignore
             callable = callable.__wrapped__  # type: ignore
         else:
-            next_ = self.revise(FSignature.from_callable(callable))
+            # retrieved once, for both the FSignature and the Mapper
+            private_signature = inspect.signature(callable)
+            next_ = self.revise(FSignature.from_native(private_signature))
+
+        next_.validate()
+        mapper = Mapper(next_, callable, private_signature=private_signature)
+        # Resolved once: the mapper assigned below is applied through
+        # ``Mapper._map_arguments`` (skipping ``CallArguments``), while a
+        # reassigned ``__mapper__`` is still called.
+        map_arguments = mapper._map_arguments
 
         # Unrevised; not wrapped
         if asyncio.iscoroutinefunction(callable):
             @functools.wraps(callable)
             async def inner(*args, **kwargs):
                 # pylint: disable=E1102, not-callable
-                mapped = inner.__mapper__(*args, **kwargs)
-                return await callable(*mapped.args, **mapped.kwargs)
+                if inner.__mapper__ is mapper:
+                    mapped_args, mapped_kwargs = map_arguments(args, kwargs)
+                else:
+                    mapped = inner.__mapper__(*args, **kwargs)
+                    mapped_args, mapped_kwargs = mapped.args, mapped.kwargs
+                return await callable(*mapped_args, **mapped_kwargs)
         else:
             @functools.wraps(callable)  # type: ignore
             def inner(*args, **kwargs):
                 # pylint: disable=E1102, not-callable
-                mapped = inner.__mapper__(*args, **kwargs)
-                return callable(*mapped.args, **mapped.kwargs)
+                if inner.__mapper__ is mapper:
+                    mapped_args, mapped_kwargs = map_arguments(args, kwargs)
+                else:
+                    mapped = inner.__mapper__(*args, **kwargs)
+                    mapped_args, mapped_kwargs = mapped.args, mapped.kwargs
+                return callable(*mapped_args, **mapped_kwargs)
 
-        next_.validate()
-        inner.__mapper__ = Mapper(next_, callable)  # type: ignore
+        inner.__mapper__ = mapper  # type: ignore
         inner.__signature__ = inner.__mapper__.public_signature  # type: ignore
         return inner
 
@@ -431,9 +839,12 @@ class copy(Revision):  # pylint: disable=C0103, invalid-name
                 findparam(self.signature, self.include)
             ))
         elif self.exclude:
-            excluded = list(findparam(self.signature, self.exclude))
+            excluded = {
+                id(param) for param in findparam(self.signature, self.exclude)
+            }
             return self.signature.replace(parameters=[
-                param for param in self.signature if param not in excluded
+                param for param in self.signature
+                if id(param) not in excluded
             ])
         return self.signature
 
@@ -608,18 +1019,16 @@ class synthesize(Revision):  # pylint: disable=C0103, invalid-name
         :paramref:`~forge.synthesize.named_parameters`
     """
     def __init__(self, *parameters, **named_parameters):
-        self.parameters = [
-            *parameters,
-            *[
-                param.replace(
-                    name=name,
-                    interface_name=param.interface_name or name,
-                ) for name, param in sorted(
-                    named_parameters.items(),
-                    key=lambda i: i[1]._creation_order,
-                )
-            ]
-        ]
+        self.parameters = list(parameters)
+        self.parameters.extend(
+            param.replace(
+                name=name,
+                interface_name=param.interface_name or name,
+            ) for name, param in sorted(
+                named_parameters.items(),
+                key=lambda i: i[1]._creation_order,
+            )
+        )
 
     def revise(self, previous: FSignature) -> FSignature:
         """
@@ -750,11 +1159,13 @@ class delete(Revision):  # pylint: disable=C0103, invalid-name
         if not self.multiple:
             del excluded[1:]
 
+        # compare by identity: ``FParameter.__eq__`` compares every attribute
+        excluded_ids = {id(param) for param in excluded}
         # https://github.com/python/mypy/issues/5156
         return previous.replace(  # type: ignore
             parameters=[
                 param for param in previous
-                if param not in excluded
+                if id(param) not in excluded_ids
             ],
             __validate_parameters__=False,
         )
@@ -956,10 +1367,14 @@ class modify(Revision):  # pylint: disable=C0103, invalid-name
         if not self.multiple:
             del matched[1:]
 
+        # compare by identity: ``FParameter.__eq__`` compares every attribute
+        matched_ids = {id(param) for param in matched}
         # https://github.com/python/mypy/issues/5156
         return previous.replace(  # type: ignore
             parameters=[
-                param.replace(**self.updates) if param in matched else param
+                param.replace(**self.updates)
+                if id(param) in matched_ids
+                else param
                 for param in previous
             ],
             __validate_parameters__=False,
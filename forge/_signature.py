@@ -1,6 +1,5 @@
 import builtins
 import collections
-import functools
 import inspect
 import types
 import typing
@@ -17,14 +16,19 @@ KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
 VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
 
 _PARAMETER_KIND_STRINGS = {
-    inspect.Parameter.POSITIONAL_ONLY: 'positional only',
-    inspect.Parameter.POSITIONAL_OR_KEYWORD: 'positional or keyword',
-    inspect.Parameter.VAR_POSITIONAL: 'variable positional',
-    inspect.Parameter.KEYWORD_ONLY: 'keyword only',
-    inspect.Parameter.VAR_KEYWORD: 'variable keyword',
+    POSITIONAL_ONLY: 'positional only',
+    POSITIONAL_OR_KEYWORD: 'positional or keyword',
+    VAR_POSITIONAL: 'variable positional',
+    KEYWORD_ONLY: 'keyword only',
+    VAR_KEYWORD: 'variable keyword',
 }
 _get_pk_string = _PARAMETER_KIND_STRINGS.__getitem__
 
+_PARAMETER_KIND_PREFIXES = {
+    VAR_POSITIONAL: '*',
+    VAR_KEYWORD: '**',
+}
+
 
 class Factory(immutable.Immutable):
     """
@@ -43,6 +47,9 @@ class Factory(immutable.Immutable):
     def __repr__(self) -> str:
         return '<{} {}>'.format(type(self).__name__, self.factory.__qualname__)
 
+    def __hash__(self) -> int:
+        return hash(self.factory)
+
     def __call__(self) -> typing.Any:
         return self.factory()
 
@@ -73,6 +80,64 @@ _TYPE_FP_VALIDATOR = typing.Optional[
 ]
 _TYPE_FP_METADATA = typing.Mapping
 
+_EMPTY_METADATA = \
+    types.MappingProxyType({})  # type: types.MappingProxyType
+"""Shared, read-only metadata for parameters that don't supply any"""
+
+
+def _as_metadata(
+        value: typing.Optional[_TYPE_FP_METADATA]
+    ) -> types.MappingProxyType:
+    """
+    Wrap a ``metadata`` argument in a read-only proxy. Values that are already
+    proxies (e.g. when an :class:`~forge.FParameter` is replaced) are passed
+    through rather than wrapped a second time.
+
+    :param value: the ``metadata`` argument
+    :returns: a read-only view of the metadata
+    """
+    if isinstance(value, types.MappingProxyType):
+        return value
+    elif not value:
+        return _EMPTY_METADATA
+    return types.MappingProxyType(value)
+
+
+def _as_callables(value: typing.Any) -> typing.Tuple[typing.Callable, ...]:
+    """
+    Normalize a ``converter`` or ``validator`` argument (``None``, a callable,
+    or an iterable of callables) into a tuple of callables.
+
+    :param value: the ``converter`` or ``validator`` argument
+    :returns: a (possibly empty) tuple of callables
+    """
+    if value is None:
+        return ()
+    elif callable(value):
+        return (value,)
+    return tuple(value)
+
+
+_STABLE_REPR_TYPES = (
+    type(None), bool, int, float, complex, str, bytes, type, Factory,
+)
+"""Types whose instances' ``repr`` can't change after construction"""
+
+
+def _has_stable_repr(value: typing.Any) -> bool:
+    """
+    Determine whether the ``repr`` of a value can be cached, i.e. the value is
+    of an immutable scalar type, a class (e.g. :class:`~forge.empty`) or a
+    :class:`~forge.Factory`.
+    Mutable values (e.g. a ``list`` default) may be changed after they are
+    first rendered.
+
+    :param value: the value to check
+    :returns: whether the ``repr`` of :paramref:`._has_stable_repr.value` is
+        stable
+    """
+    return isinstance(value, _STABLE_REPR_TYPES)
+
 
 class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
     """
@@ -113,9 +178,10 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         For example, to achieve :code:`f(x: int)`, ``type`` is ``int``.
     :param converter: a callable or iterable of callables that receive a
         ``ctx`` argument, a ``name`` argument and a ``value`` argument
-        for transforming inputs.
-    :param validator: a callable that receives a ``ctx`` argument,
-        a ``name`` argument and a ``value`` argument for validating inputs.
+        for transforming inputs; iterables are stored as a tuple.
+    :param validator: a callable or iterable of callables that receive a
+        ``ctx`` argument, a ``name`` argument and a ``value`` argument for
+        validating inputs; iterables are stored as a tuple.
     :param bound: whether the parameter is visible in the signature
         (requires ``default`` or ``factory`` if True)
     :param contextual: whether the parameter will be passed to
@@ -153,6 +219,12 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         'bound',
         'contextual',
         'metadata',
+        '_converters',
+        '_validators',
+        '_passthrough',
+        '_hash',
+        '_str',
+        '_native',
     )
 
     empty = empty
@@ -200,6 +272,14 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         if bound and default is empty:
             raise TypeError('bound arguments must have a default value')
 
+        converters = _as_callables(converter)
+        if converter is not None and not callable(converter):
+            converter = converters
+
+        validators = _as_callables(validator)
+        if validator is not None and not callable(validator):
+            validator = validators
+
         super().__init__(
             kind=kind,
             name=name or interface_name,
@@ -210,20 +290,43 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
             validator=validator,
             contextual=contextual,
             bound=bound,
-            metadata=types.MappingProxyType(metadata or {}),
+            metadata=_as_metadata(metadata),
+        )
+        object.__setattr__(self, '_converters', converters)
+        object.__setattr__(self, '_validators', validators)
+        object.__setattr__(
+            self,
+            '_passthrough',
+            not (converters or validators) and
+            # ``type`` is shadowed by the parameter of the same name
+            self.__class__.apply_conversion is FParameter.apply_conversion and
+            self.__class__.apply_validation is FParameter.apply_validation,
         )
+        object.__setattr__(self, '_hash', None)
+        object.__setattr__(self, '_str', None)
+        object.__setattr__(self, '_native', None)
 
     def __str__(self) -> str:
         """
-        Generates a string representation of the :class:`~forge.FParameter`
+        Generates a string representation of the :class:`~forge.FParameter`.
+        The representation is cached after first use, unless the
+        :paramref:`~forge.FParameter.default` is mutable (e.g. a ``list``) and
+        could render differently later.
         """
-        if self.kind == self.VAR_POSITIONAL:
-            prefix = '*'
-        elif self.kind == self.VAR_KEYWORD:
-            prefix = '**'
-        else:
-            prefix = ''
-
+        # pylint: disable=E0203, access-member-before-definition
+        if self._str is not None:
+            return self._str
+        string = self._format()
+        if _has_stable_repr(self.default):
+            object.__setattr__(self, '_str', string)
+        return string
+
+    def _format(self) -> str:
+        """
+        Formats the string representation returned by
+        :meth:`~forge.FParameter.__str__`
+        """
+        prefix = _PARAMETER_KIND_PREFIXES.get(self.kind, '')
         mapped = \
             '{prefix}{name}'.format(
                 prefix=prefix,
@@ -240,7 +343,7 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
             else '{mapped}:{annotation}'.format(
                 mapped=mapped,
                 annotation=self.type.__name__ \
-                    if inspect.isclass(self.type) \
+                    if isinstance(self.type, type) \
                     else str(self.type),
             )
 
@@ -252,7 +355,32 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
             )
 
     def __repr__(self) -> str:
-        return '<{} "{}">'.format(type(self).__name__, str(self))
+        return '<{} "{}">'.format(type(self).__name__, self)
+
+    def __hash__(self) -> int:
+        """
+        Hashes the same attributes that are used for equality, so that
+        equivalent instances can be used interchangeably as mapping keys.
+        The hash is computed on first use and then cached.
+
+        :raises TypeError: if an attribute value (e.g. ``default``) is
+            unhashable
+        """
+        # pylint: disable=E0203, access-member-before-definition
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash((
+                self.kind,
+                self.name,
+                self.interface_name,
+                self.default,
+                self.type,
+                self.converter,
+                self.validator,
+                self.bound,
+                self.contextual,
+                frozenset(self.metadata.items()),
+            )))
+        return self._hash
 
     def apply_default(self, value: typing.Any) -> typing.Any:
         """
@@ -284,14 +412,10 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :returns: the converted value
         """
         # pylint: disable=W0621, redefined-outer-name
-        if self.converter is None:
-            return value
-        elif isinstance(self.converter, typing.Iterable):
-            return functools.reduce(
-                lambda val, func: func(ctx, self.name, val),
-                [value, *self.converter],
-            )
-        return self.converter(ctx, self.name, value)
+        name = self.name
+        for convert in self._converters:
+            value = convert(ctx, name, value)
+        return value
 
     def apply_validation(
             self,
@@ -308,11 +432,9 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :returns: the (unchanged) validated value
         """
         # pylint: disable=W0621, redefined-outer-name
-        if isinstance(self.validator, typing.Iterable):
-            for validate in self.validator:
-                validate(ctx, self.name, value)
-        elif self.validator is not None:
-            self.validator(ctx, self.name, value)
+        name = self.name
+        for validate in self._validators:
+            validate(ctx, name, value)
         return value
 
     def __call__(
@@ -339,6 +461,9 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         :param value: the user-supplied (or default) value
         """
         # pylint: disable=W0621, redefined-outer-name
+        if self._passthrough:
+            # nothing to convert or validate
+            return self.apply_default(value)
         defaulted = self.apply_default(value)
         converted = self.apply_conversion(ctx, defaulted)
         return self.apply_validation(ctx, converted)
@@ -348,16 +473,21 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         """
         A native representation of this :class:`~forge.FParameter` as an
         :class:`inspect.Parameter`, fit for an instance of
-        :class:`inspect.Signature`
+        :class:`inspect.Signature`.
+        The (immutable) :class:`inspect.Parameter` is built on first access and
+        then cached.
         """
-        if not self.name:
-            raise TypeError('Cannot generate an unnamed parameter')
-        return inspect.Parameter(
-            name=self.name,
-            kind=self.kind,
-            default=empty.ccoerce_native(self.default),
-            annotation=empty.ccoerce_native(self.type),
-        )
+        # pylint: disable=E0203, access-member-before-definition
+        if self._native is None:
+            if not self.name:
+                raise TypeError('Cannot generate an unnamed parameter')
+            object.__setattr__(self, '_native', inspect.Parameter(
+                name=self.name,
+                kind=self.kind,
+                default=empty.ccoerce_native(self.default),
+                annotation=empty.ccoerce_native(self.type),
+            ))
+        return self._native
 
     def replace(
             self,
@@ -394,24 +524,38 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
         # pylint: disable=E1120, no-value-for-parameter
         # pylint: disable=W0622, redefined-builtin
         # pylint: disable=R0913, too-many-arguments
+        # pylint: disable=R0912, too-many-branches
         if factory is not _void and default is _void:
             default = empty
 
-        return immutable.replace(self, **{
-            k: v for k, v in {
-                'kind': kind,
-                'name': name,
-                'interface_name': interface_name,
-                'default': default,
-                'factory': factory,
-                'type': type,
-                'converter': converter,
-                'validator': validator,
-                'bound': bound,
-                'contextual': contextual,
-                'metadata': metadata,
-            }.items() if v is not _void
-        })
+        updates = {}
+        if kind is not _void:
+            updates['kind'] = kind
+        if name is not _void:
+            updates['name'] = name
+        if interface_name is not _void:
+            updates['interface_name'] = interface_name
+        if default is not _void:
+            updates['default'] = default
+        if factory is not _void:
+            updates['factory'] = factory
+        if type is not _void:
+            updates['type'] = type
+        if converter is not _void:
+            updates['converter'] = converter
+        if validator is not _void:
+            updates['validator'] = validator
+        if bound is not _void:
+            updates['bound'] = bound
+        if contextual is not _void:
+            updates['contextual'] = contextual
+        if metadata is not _void:
+            updates['metadata'] = metadata
+
+        if not updates:
+            # nothing to replace; instances are immutable, so share this one
+            return self
+        return immutable.replace(self, **updates)
 
     @classmethod
     def from_native(cls, native: inspect.Parameter) -> 'FParameter':
@@ -427,12 +571,19 @@ class FParameter(immutable.Immutable, metaclass=CreationOrderMeta):
             :returns: a new instance of :class:`~forge.FParameter`, using
             :paramref:`~forge.FParameter.from_native.native` as a template
         """
+        # inlined ``empty.ccoerce_synthetic``; this runs for every parameter
+        # of every revised callable
+        default, annotation = native.default, native.annotation
         return cls(  # type: ignore
             kind=native.kind,
             name=native.name,
             interface_name=native.name,
-            default=cls.empty.ccoerce_synthetic(native.default),
-            type=cls.empty.ccoerce_synthetic(native.annotation),
+            default=default \
+                if default is not native.empty \
+                else cls.empty,
+            type=annotation \
+                if annotation is not native.empty \
+                else cls.empty,
         )
 
     @classmethod
@@ -690,12 +841,23 @@ class VarPositional(collections.abc.Iterable):
     Implements :class:`collections.abc.Iterable`, with provided: ``__iter__``.
     Inherits method: ``__next__``.
 
+    Instances are immutable; use ``__call__`` to generate a variant.
+
     :param name: see :paramref:`~forge.FParameter.name`
     :param type: see :paramref:`~forge.FParameter.type`
     :param converter: see :paramref:`~forge.FParameter.converter`
     :param validator: see :paramref:`~forge.FParameter.validator`
     :param metadata: see :paramref:`~forge.FParameter.metadata`
     """
+    __slots__ = (
+        'name',
+        'type',
+        'converter',
+        'validator',
+        'metadata',
+        '_fparameter',
+    )
+
     _default_name = 'args'
 
     def __init__(
@@ -708,11 +870,22 @@ class VarPositional(collections.abc.Iterable):
             metadata: typing.Optional[_TYPE_FP_METADATA] = None
         ) -> None:
         # pylint: disable=W0622, redefined-builtin
-        self.name = name or self._default_name
-        self.type = type
-        self.converter = converter
-        self.validator = validator
-        self.metadata = metadata
+        object.__setattr__(self, 'name', name or self._default_name)
+        object.__setattr__(self, 'type', type)
+        object.__setattr__(self, 'converter', converter)
+        object.__setattr__(self, 'validator', validator)
+        object.__setattr__(self, 'metadata', metadata)
+        object.__setattr__(self, '_fparameter', None)
+
+    __setattr__ = immutable.Immutable.__setattr__
+
+    def __getattr__(self, key: str) -> typing.Any:
+        """
+        Solely for placating mypy and pylint, as the instance variables are
+        written with :func:`object.__setattr__`;
+        see :meth:`forge._immutable.Immutable.__getattr__`.
+        """
+        return object.__getattribute__(self, key)
 
     @property
     def fparameter(self) -> FParameter:
@@ -722,15 +895,23 @@ class VarPositional(collections.abc.Iterable):
             :class:`~forge.FParameter` of :term:`parameter kind`
             :term:`var-positional`, with attributes ``name``, ``converter``,
             ``validator`` and ``metadata`` from the instance.
+            The :class:`~forge.FParameter` is built once and then reused.
         """
         # pylint: disable=E1101, no-member
-        return FParameter.create_var_positional(
-            name=self.name,
-            type=self.type,
-            converter=self.converter,
-            validator=self.validator,
-            metadata=self.metadata,
-        )
+        # pylint: disable=E0203, access-member-before-definition
+        if self._fparameter is None:
+            object.__setattr__(
+                self,
+                '_fparameter',
+                FParameter.create_var_positional(
+                    name=self.name,
+                    type=self.type,
+                    converter=self.converter,
+                    validator=self.validator,
+                    metadata=self.metadata,
+                ),
+            )
+        return self._fparameter
 
     def __iter__(self) -> typing.Iterator:
         """
@@ -808,12 +989,16 @@ class VarKeyword(collections.abc.Mapping):
     ``__iter__`` and ``__len__``. Inherits methods: ``__contains__``, ``keys``,
     ``items``, ``values``, ``get``, ``__eq__`` and ``__ne__``.
 
+    Instances are immutable; use ``__call__`` to generate a variant.
+
     :param name: see :paramref:`~forge.FParameter.name`
     :param type: see :paramref:`~forge.FParameter.type`
     :param converter: see :paramref:`~forge.FParameter.converter`
     :param validator: see :paramref:`~forge.FParameter.validator`
     :param metadata: see :paramref:`~forge.FParameter.metadata`
     """
+    __slots__ = ('name', 'type', 'converter', 'validator', 'metadata')
+
     _default_name = 'kwargs'
 
     def __init__(
@@ -826,11 +1011,21 @@ class VarKeyword(collections.abc.Mapping):
             metadata: typing.Optional[_TYPE_FP_METADATA] = None
         ) -> None:
         # pylint: disable=W0622, redefined-builtin
-        self.name = name or self._default_name
-        self.type = type
-        self.converter = converter
-        self.validator = validator
-        self.metadata = metadata
+        object.__setattr__(self, 'name', name or self._default_name)
+        object.__setattr__(self, 'type', type)
+        object.__setattr__(self, 'converter', converter)
+        object.__setattr__(self, 'validator', validator)
+        object.__setattr__(self, 'metadata', metadata)
+
+    __setattr__ = immutable.Immutable.__setattr__
+
+    def __getattr__(self, key: str) -> typing.Any:
+        """
+        Solely for placating mypy and pylint, as the instance variables are
+        written with :func:`object.__setattr__`;
+        see :meth:`forge._immutable.Immutable.__getattr__`.
+        """
+        return object.__getattribute__(self, key)
 
     @property
     def fparameter(self) -> FParameter:
@@ -869,12 +1064,12 @@ class VarKeyword(collections.abc.Mapping):
         """
         Concrete method for :class:`collections.abc.Mapping`
 
-        :returns: an iterable consisting of one item: the representation of this
-            :class:`~forge._parameter.VarKeyword` as a
-            :class:`~forge.FParameter` via
-            :attr:`~forge._parameter.VarKeyword.fparameter`.
+        :returns: an iterable consisting of one item: the
+            :paramref:`~forge._parameter.VarKeyword.name`, which keys the
+            representation of this :class:`~forge._parameter.VarKeyword` as a
+            :class:`~forge.FParameter`.
         """
-        return iter({self.name: self.fparameter})
+        return iter((self.name,))
 
     def __len__(self) -> int:
         """
@@ -956,7 +1151,7 @@ def findparam(
     """
     if isinstance(selector, str):
         return filter(lambda param: param.name == selector, parameters)
-    elif isinstance(selector, typing.Iterable):
+    elif isinstance(selector, collections.abc.Iterable):
         selector = list(selector)
         return filter(
             lambda param: param.name in selector,  # type: ignore
@@ -1029,7 +1224,13 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
     :param __validate_parameters__: whether the sequence of provided parameters
         should be validated
     """
-    __slots__ = ('_data', 'return_annotation')
+    __slots__ = (
+        '_data',
+        'return_annotation',
+        '_str',
+        '_native',
+        '_parameters',
+    )
 
     def __init__(
             self,
@@ -1042,6 +1243,9 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
             _data=list(parameters or ()),
             return_annotation=return_annotation,
         )
+        object.__setattr__(self, '_str', None)
+        object.__setattr__(self, '_native', None)
+        object.__setattr__(self, '_parameters', None)
         if __validate_parameters__:
             self.validate()
 
@@ -1143,6 +1347,25 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
         )
 
     def __str__(self) -> str:
+        """
+        Generates a string representation of the :class:`~forge.FSignature`.
+        The representation is cached after first use, unless a parameter's
+        :paramref:`~forge.FParameter.default` is mutable (e.g. a ``list``) and
+        could render differently later.
+        """
+        # pylint: disable=E0203, access-member-before-definition
+        if self._str is not None:
+            return self._str
+        string = self._format()
+        if all(_has_stable_repr(param.default) for param in self._data):
+            object.__setattr__(self, '_str', string)
+        return string
+
+    def _format(self) -> str:
+        """
+        Formats the string representation returned by
+        :meth:`~forge.FSignature.__str__`
+        """
         components = []
         if self:
             pos_param = next(
@@ -1225,12 +1448,17 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
     def native(self) -> inspect.Signature:
         """
         Provides a representation of this :class:`~forge.FSignature` as an
-        instance of :class:`inspect.Signature`
+        instance of :class:`inspect.Signature`.
+        The (immutable) :class:`inspect.Signature` is built on first access and
+        then cached.
         """
-        return inspect.Signature(
-            [param.native for param in self if not param.bound],
-            return_annotation=self.return_annotation,
-        )
+        # pylint: disable=E0203, access-member-before-definition
+        if self._native is None:
+            object.__setattr__(self, '_native', inspect.Signature(
+                [param.native for param in self if not param.bound],
+                return_annotation=self.return_annotation,
+            ))
+        return self._native
 
     def replace(
             self,
@@ -1264,11 +1492,15 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
     @property
     def parameters(self) -> types.MappingProxyType:
         """
-        The signature's :class:`~forge.FParameter <parameters>`
+        The signature's :class:`~forge.FParameter <parameters>`.
+        The (read-only) mapping is built on first access and then cached.
         """
-        return types.MappingProxyType(
-            collections.OrderedDict([(p.name, p) for p in self._data])
-        )
+        # pylint: disable=E0203, access-member-before-definition
+        if self._parameters is None:
+            object.__setattr__(self, '_parameters', types.MappingProxyType(
+                collections.OrderedDict([(p.name, p) for p in self._data])
+            ))
+        return self._parameters
 
     def validate(self):
         """
@@ -1305,13 +1537,17 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
         # pylint: disable=R0912, too-many-branches
         name_set = set()  # type: typing.Set[str]
         iname_set = set()  # type: typing.Set[str]
+        last = None  # type: typing.Optional[FParameter]
         for i, current in enumerate(self._data):
             if not isinstance(current, FParameter):
                 raise TypeError(
                     "Received non-FParameter '{}'".\
                     format(current)
                 )
-            elif not (current.name and current.interface_name):
+
+            name, interface_name, kind = \
+                current.name, current.interface_name, current.kind
+            if not (name and interface_name):
                 raise ValueError(
                     "Received unnamed parameter: '{}'".\
                     format(current)
@@ -1322,47 +1558,47 @@ class FSignature(immutable.Immutable, collections.abc.Sequence):
                         'Only the first parameter can be contextual'
                     )
 
-            if current.name in name_set:
+            if name in name_set:
                 raise ValueError(
                     "Received multiple parameters with name '{}'".\
-                    format(current.name)
+                    format(name)
                 )
-            name_set.add(current.name)
+            name_set.add(name)
 
-            if current.interface_name in iname_set:
+            if interface_name in iname_set:
                 raise ValueError(
                     "Received multiple parameters with interface_name '{}'".\
-                    format(current.interface_name)
+                    format(interface_name)
                 )
-            iname_set.add(current.interface_name)
-
-            last = self._data[i-1] if i > 0 else None
-            if not last:
-                continue
+            iname_set.add(interface_name)
 
-            elif current.kind < last.kind:
-                raise SyntaxError(
-                    "'{current}' of kind '{current.kind.name}' follows "
-                    "'{last}' of kind '{last.kind.name}'".\
-                    format(current=current, last=last)
-                )
-            elif current.kind is last.kind:
-                if current.kind is FParameter.VAR_POSITIONAL:
-                    raise TypeError(
-                        'Received multiple variable-positional parameters'
-                    )
-                elif current.kind is FParameter.VAR_KEYWORD:
-                    raise TypeError(
-                        'Received multiple variable-keyword parameters'
-                    )
-                elif current.kind in (
-                        FParameter.POSITIONAL_ONLY,
-                        FParameter.POSITIONAL_OR_KEYWORD
-                    ) \
-                    and last.default is not empty \
-                    and current.default is empty:
+            if last is not None:
+                last_kind = last.kind
+                if kind < last_kind:
                     raise SyntaxError(
-                        'non-default parameter follows default parameter'
+                        "'{current}' of kind '{current.kind.name}' follows "
+                        "'{last}' of kind '{last.kind.name}'".\
+                        format(current=current, last=last)
                     )
+                elif kind is last_kind:
+                    if kind is VAR_POSITIONAL:
+                        raise TypeError(
+                            'Received multiple variable-positional parameters'
+                        )
+                    elif kind is VAR_KEYWORD:
+                        raise TypeError(
+                            'Received multiple variable-keyword parameters'
+                        )
+                    elif (
+                            kind is POSITIONAL_ONLY or
+                            kind is POSITIONAL_OR_KEYWORD
+                        ) \
+                        and last.default is not empty \
+                        and current.default is empty:
+                        raise SyntaxError(
+                            'non-default parameter follows default parameter'
+                        )
+
+            last = current
 
 fsignature = FSignature.from_callable  # Convenience
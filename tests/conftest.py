@@ -3,6 +3,7 @@ import asyncio
 import pytest
 
 import forge
+from forge._signature import FParameter
 
 
 @pytest.fixture
@@ -24,3 +25,16 @@ def reset_run_validators():
     prerun = forge._config._run_validators
     yield
     forge._config._run_validators = prerun
+
+
+@pytest.fixture(params=['__call__', 'apply_conversion', 'apply_validation'])
+def overridden_fparameter(request):
+    """
+    Helper fixture that provides a subclass of ``FParameter`` with one method
+    (``__call__``, ``apply_conversion`` or ``apply_validation``) overridden to
+    raise ``TypeError('overridden')``.
+    """
+    def apply(self, ctx, value):
+        # pylint: disable=W0613, unused-argument
+        raise TypeError('overridden')
+    return type('SubFParameter', (FParameter,), {request.param: apply})
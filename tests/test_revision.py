@@ -1,6 +1,6 @@
 import asyncio
 import inspect
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -194,6 +194,132 @@ class TestMapper:
 
         assert mapper() == CallArguments(a=1)
 
+    def test_private_signature(self):
+        """
+        Ensure that a supplied ``private_signature`` is used instead of
+        retrieving the callable's signature
+        """
+        fsig = FSignature([forge.arg('a')])
+        private_signature = inspect.Signature([
+            inspect.Parameter('a', POSITIONAL_OR_KEYWORD),
+        ])
+        mapper = Mapper(
+            fsig,
+            lambda *args, **kwargs: None,
+            private_signature=private_signature,
+        )
+        assert mapper.private_signature is private_signature
+        assert mapper(1) == CallArguments(1)
+
+    def test__call__private_layout(self):
+        """
+        Ensure that mapped arguments are laid out for the private signature:
+        positional and var-positional arguments, then keyword-only arguments
+        (with defaults) and var-keyword arguments (fresh for every call).
+        """
+        fsig = FSignature([
+            forge.pos('a'),
+            forge.arg('b'),
+            forge.vpo('args'),
+            forge.kwo('c'),
+            forge.vkw('kwargs'),
+        ])
+        def func(a, b=2, *args, c, d=4, **kwargs):
+            # pylint: disable=W0613, unused-argument
+            pass
+        mapper = Mapper(fsig, func)
+
+        assert mapper(1, 2, 3, c=5, e=6) == \
+            CallArguments(1, 2, 3, c=5, d=4, e=6)
+        assert mapper(1, 2, c=5) == CallArguments(1, 2, c=5, d=4)
+
+    def test__call__fparameter_subclass(self, overridden_fparameter):
+        """
+        Ensure that overridden ``FParameter`` methods are called when mapping
+        parameters without converters or validators
+        """
+        fsig = FSignature([overridden_fparameter(POSITIONAL_OR_KEYWORD, 'a')])
+        mapper = Mapper(fsig, lambda a: None)
+        with pytest.raises(TypeError) as excinfo:
+            mapper(1)
+        assert excinfo.value.args[0] == 'overridden'
+
+    @pytest.mark.parametrize(('fsig', 'func', 'identity'), [
+        pytest.param(
+            FSignature([forge.arg('a'), forge.arg('b', default=2)]),
+            lambda a, b=2: None,
+            True,
+            id='identity',
+        ),
+        pytest.param(
+            FSignature([forge.arg('a'), forge.arg('b', default=3)]),
+            lambda a, b=2: None,
+            False,
+            id='different_default',
+        ),
+        pytest.param(
+            FSignature([forge.arg('a'), forge.arg('b', converter=int)]),
+            lambda a, b: None,
+            False,
+            id='converter',
+        ),
+        pytest.param(
+            FSignature([forge.arg('x', 'a'), forge.arg('b', default=2)]),
+            lambda a, b=2: None,
+            False,
+            id='renamed',
+        ),
+        pytest.param(
+            FSignature([forge.arg('a'), forge.kwo('b', default=2)]),
+            lambda a, *, b=2: None,
+            False,
+            id='keyword_only',
+        ),
+    ])
+    def test_identity(self, fsig, func, identity):
+        """
+        Ensure that a ``Mapper`` is only considered an identity when the public
+        and private signatures are interchangeable, and have no keyword-only
+        parameters.
+        """
+        mapper = Mapper(fsig, func)
+        # pylint: disable=W0212, protected-access
+        assert mapper._identity is identity
+
+    @pytest.mark.parametrize(('args', 'kwargs'), [
+        pytest.param((1, 2), {}, id='positional'),
+        pytest.param((1, 2, 3), {}, id='var_positional'),
+        pytest.param((1,), {}, id='omitted_default'),
+        pytest.param((), {'a': 1}, id='keyword'),
+        pytest.param((1,), {'b': 2, 'c': 3}, id='var_keyword'),
+        pytest.param((forge.Factory(lambda: 1), 2), {}, id='factory'),
+        pytest.param(
+            (1, 2, forge.Factory(lambda: 3)), {},
+            id='var_positional_factory',
+        ),
+    ])
+    def test__call__identity(self, args, kwargs):
+        """
+        Ensure that mapping through an identity ``Mapper`` produces the same
+        arguments as the full mapping (here forced by a no-op converter).
+        """
+        def func(a, b=2, *args, **kwargs):
+            # pylint: disable=W0613, unused-argument
+            pass
+        fsig = FSignature.from_callable(func)
+        mapper = Mapper(fsig, func)
+        full = Mapper(
+            FSignature([
+                fsig[0].replace(converter=lambda ctx, name, value: value),
+                *fsig[1:],
+            ]),
+            func,
+        )
+        # pylint: disable=W0212, protected-access
+        assert mapper._identity
+        assert not full._identity
+        assert mapper(*args, **kwargs) == full(*args, **kwargs)
+
     def test__call__binding_error_raises_named(self):
         """
         Ensure that a lack of required (non-default) arguments raises a
@@ -209,6 +335,43 @@ class TestMapper:
         assert excinfo.value.args[0] == \
             "func() missing a required argument: 'a'"
 
+    @pytest.mark.parametrize(('args', 'kwargs'), [
+        pytest.param((1, 2), {'d': 4}, id='required'),
+        pytest.param((1,), {'b': 2, 'c': 3, 'd': 4, 'e': 5}, id='keywords'),
+        pytest.param((1, 2, 3, 6, 7), {'d': 4, 'f': 8}, id='var'),
+        pytest.param((), {'d': 4}, id='missing'),
+        pytest.param((1, 2), {'b': 2, 'd': 4}, id='multiple'),
+        pytest.param((1, 2), {'a': 1, 'd': 4}, id='positional_only'),
+    ])
+    @pytest.mark.parametrize(('has_var',), [(True,), (False,)])
+    def test__bind_public(self, args, kwargs, has_var):
+        """
+        Ensure that the precomputed public binding matches
+        ``inspect.Signature.bind`` (with defaults applied), including failures.
+        """
+        fsig = FSignature([
+            forge.pos('a'),
+            forge.arg('b'),
+            forge.arg('c', default=3),
+            *([forge.vpo('args')] if has_var else []),
+            forge.kwo('d'),
+            forge.kwo('e', default=5),
+            *([forge.vkw('kwargs')] if has_var else []),
+        ])
+        def func(*args, **kwargs):
+            # pylint: disable=W0613, unused-argument
+            pass
+        mapper = Mapper(fsig, func)
+
+        try:
+            expected = dict(mapper._bind_native(args, kwargs))
+        except TypeError as exc:
+            with pytest.raises(TypeError) as excinfo:
+                mapper._bind_public(args, kwargs)
+            assert excinfo.value.args == exc.args
+        else:
+            assert mapper._bind_public(args, kwargs) == expected
+
     @pytest.mark.parametrize(('from_name', 'to_name'), [
         pytest.param('a', 'a', id='same_name'),
         pytest.param('a', 'b', id='diff_name'),
@@ -483,6 +646,28 @@ class TestRevision:
         func3.__mapper__.assert_called_once_with(**call_args.kwargs)
         func2.__mapper__.assert_not_called()
 
+    @pytest.mark.parametrize(('as_coroutine',), [(True,), (False,)])
+    def test__call__maps_arguments(self, loop, as_coroutine):
+        """
+        Ensure that the wrapper maps arguments with the ``Mapper`` it was
+        created with directly, rather than through ``Mapper.__call__``.
+        """
+        rev = Revision()
+        if as_coroutine:
+            async def func(a, b=2):
+                return CallArguments(a, b=b)
+        else:
+            def func(a, b=2):
+                return CallArguments(a, b=b)
+
+        func2 = rev(func)
+        with patch.object(Mapper, '__call__') as mock_call:
+            result = func2(1)
+            if as_coroutine:
+                result = loop.run_until_complete(result)
+        assert result == CallArguments(1, b=2)
+        mock_call.assert_not_called()
+
     def test_revise(self):
         """
         Ensure that the revise function is the identity function
@@ -9,6 +9,7 @@ import pytest
 import forge
 import forge._immutable as immutable
 import forge._signature
+from forge._exceptions import ImmutableInstanceError
 from forge._marker import empty
 from forge._signature import (
     KEYWORD_ONLY,
@@ -97,6 +98,12 @@ class TestFactory:
             pass
         assert repr(Factory(func)) == '<Factory {}>'.format(func.__qualname__)
 
+    def test__hash__(self):
+        """
+        Ensure equivalent factories hash equally
+        """
+        assert hash(Factory(dummy_func)) == hash(Factory(dummy_func))
+
     def test__call__(self):
         """
         Ensure calls to the factory are transparently routed to the underlying
@@ -269,6 +276,43 @@ class TestFParameter:
         assert str(fparam) == expected
         assert repr(fparam) == '<FParameter "{}">'.format(expected)
 
+    def test__str__cached(self):
+        """
+        Ensure that the string representation is computed once and reused
+        """
+        fparam = FParameter(POSITIONAL_ONLY, 'a', default=1)
+        assert str(fparam) is str(fparam)
+
+    def test__str__mutable_default(self):
+        """
+        Ensure that the string representation reflects changes to a mutable
+        default
+        """
+        default = []
+        fparam = FParameter(POSITIONAL_ONLY, 'a', default=default)
+        assert str(fparam) == 'a=[]'
+        default.append(1)
+        assert str(fparam) == 'a=[1]'
+
+    def test__hash__(self):
+        """
+        Ensure that equivalent ``FParameter`` instances hash equally, and that
+        parameters with unhashable attribute values are unhashable.
+        """
+        kwargs = dict(
+            kind=POSITIONAL_ONLY,
+            name='a',
+            factory=dummy_func,
+            converter=dummy_converter,
+            metadata={'meta': 'data'},
+        )
+        fparam1, fparam2 = FParameter(**kwargs), FParameter(**kwargs)
+        assert hash(fparam1) == hash(fparam2)
+        assert len({fparam1, fparam2}) == 1
+
+        with pytest.raises(TypeError):
+            hash(FParameter(POSITIONAL_ONLY, 'a', default=[]))
+
     @pytest.mark.parametrize(('in_val', 'out_val'), [
         pytest.param(empty, 'default', id='empty'),
         pytest.param(*[object()] * 2, id='non_factory'), # (obj, obj)
@@ -325,6 +369,39 @@ class TestFParameter:
         )
         assert fparam.apply_conversion(ctx, value) == to_out(ctx, name, value)
 
+    def test_apply_conversion_iterable_reused(self):
+        """
+        Ensure an iterable of converters is consumed once (at construction) so
+        that it can be applied on every call
+        """
+        converter = lambda ctx, name, value: value + 1
+        fparam = FParameter(
+            POSITIONAL_ONLY,
+            name='myparam',
+            converter=(converter for i in range(2)),
+        )
+        assert fparam.apply_conversion(None, 0) == 2
+        assert fparam.apply_conversion(None, 0) == 2
+
+    def test_apply_conversion_iterable_callable(self):
+        """
+        Ensure a converter that is both callable and iterable is treated as a
+        single converter
+        """
+        class Converter:
+            def __call__(self, ctx, name, value):
+                return value + 1
+
+            def __iter__(self):
+                raise AssertionError('should not be iterated')
+
+        fparam = FParameter(
+            POSITIONAL_ONLY,
+            name='myparam',
+            converter=Converter(),
+        )
+        assert fparam.apply_conversion(None, 0) == 1
+
     @pytest.mark.parametrize(('has_validation',), [(True,), (False,)])
     def test_apply_validation(self, has_validation):
         """
@@ -404,6 +481,29 @@ class TestFParameter:
             converter.assert_called_once_with(ctx, name, mock)
             mock.assert_not_called()
 
+    def test__call__passthrough(self):
+        """
+        Ensure that calling an ``FParameter`` without converters or validators
+        only applies the default
+        """
+        fparam = FParameter(POSITIONAL_ONLY, name='a', default=1)
+        # pylint: disable=W0212, protected-access
+        assert fparam._passthrough
+        assert fparam(None, empty) == 1
+        assert fparam(None, 2) == 2
+        assert fparam(None, Factory(lambda: 3)) == 3
+
+    def test__call__passthrough_overridden(self, overridden_fparameter):
+        """
+        Ensure that overridden ``__call__``, ``apply_conversion`` and
+        ``apply_validation`` methods are called, even without converters or
+        validators
+        """
+        fparam = overridden_fparameter(POSITIONAL_ONLY, name='a')
+        with pytest.raises(TypeError) as excinfo:
+            fparam(None, 1)
+        assert excinfo.value.args[0] == 'overridden'
+
     @pytest.mark.parametrize(('rkey', 'rval'), [
         pytest.param('kind', KEYWORD_ONLY, id='kind'),
         pytest.param('default', 1, id='default'),
@@ -437,6 +537,38 @@ class TestFParameter:
                 v = Factory(dummy_func)
             assert getattr(fparam2, k) == v
 
+    def test_converter_validator_iterable_frozen(self):
+        """
+        Ensure that iterables of converters and validators are stored as tuples
+        (so they can't be mutated and remain hashable)
+        """
+        converters = [dummy_converter]
+        fparam = FParameter(
+            POSITIONAL_ONLY,
+            'a',
+            converter=converters,
+            validator=iter([dummy_validator]),
+        )
+        converters.append(dummy_converter)
+        assert fparam.converter == (dummy_converter,)
+        assert fparam.validator == (dummy_validator,)
+        assert fparam.replace(name='b').validator == (dummy_validator,)
+        hash(fparam)
+
+    def test_replace_noop(self):
+        """
+        Ensure that ``replace`` without updates returns the same instance
+        """
+        fparam = FParameter(POSITIONAL_ONLY, 'a')
+        assert fparam.replace() is fparam
+
+    def test_replace_metadata_shared(self):
+        """
+        Ensure that ``replace`` reuses (rather than re-wraps) the metadata proxy
+        """
+        fparam = FParameter(POSITIONAL_ONLY, 'a', metadata={'meta': 'data'})
+        assert fparam.replace(name='b').metadata is fparam.metadata
+
     def test_native(self):
         """
         Ensure the ``native`` property produces an expected instance of
@@ -449,11 +581,13 @@ class TestFParameter:
             default=None,
             type=int,
         )
-        param = FParameter(**kwargs).native
+        fparam = FParameter(**kwargs)
+        param = fparam.native
         assert param.kind == kwargs['kind']
         assert param.name == kwargs['name']
         assert param.default == kwargs['default']
         assert param.annotation == kwargs['type']
+        assert fparam.native is param
 
     def test_native_wo_names_raises(self):
         """
@@ -768,6 +902,41 @@ class TestVarPositional:
             interface_name=kwargs['name'],
         )
 
+    def test_fparameter_cached(self):
+        """
+        Ensure that the underlying ``FParameter`` is built once and reused.
+        """
+        varp = VarPositional()
+        fparam = self.assert_iterable_and_get_fparam(varp)
+        assert self.assert_iterable_and_get_fparam(varp) is fparam
+
+    def test_immutable(self):
+        """
+        Ensure that ``VarPositional`` instances can't be mutated
+        """
+        varp = VarPositional()
+        with pytest.raises(ImmutableInstanceError):
+            varp.name = 'b'
+
+    def test__getattr__(self):
+        """
+        Ensure that ``VarPositional.__getattr__`` raises ``AttributeError`` for unknown
+        attributes
+        """
+        varp = VarPositional()
+        with pytest.raises(AttributeError):
+            varp.missing  # pylint: disable=W0104, pointless-statement
+
+    def test__eq__hash(self):
+        """
+        Ensure that ``VarPositional`` instances compare and hash by identity
+        """
+        varp = VarPositional()
+        assert varp == varp
+        assert varp != VarPositional()
+        assert hash(varp) == hash(varp)
+
+
 class TestVarKeyword:
     @staticmethod
     def assert_mapping_and_get_fparam(vark):
@@ -846,6 +1015,31 @@ class TestVarKeyword:
         assert len(vark) == 1
         assert list(vark) == [vark.name]
 
+    def test__eq__(self):
+        """
+        Ensure that ``VarKeyword`` compares as a mapping
+        """
+        vark = VarKeyword()
+        assert vark == {vark.name: vark.fparameter}
+        assert vark != {'{}_'.format(vark.name): vark.fparameter}
+
+    def test_immutable(self):
+        """
+        Ensure that ``VarKeyword`` instances can't be mutated
+        """
+        vark = VarKeyword()
+        with pytest.raises(ImmutableInstanceError):
+            vark.name = 'b'
+
+    def test__getattr__(self):
+        """
+        Ensure that ``VarKeyword.__getattr__`` raises ``AttributeError`` for unknown
+        attributes
+        """
+        vark = VarKeyword()
+        with pytest.raises(AttributeError):
+            vark.missing  # pylint: disable=W0104, pointless-statement
+
 
 class TestParameterConvenience:
     @pytest.mark.parametrize(('name', 'obj'), [
@@ -1055,8 +1249,20 @@ class TestFSignature:
             __validate_parameters__=False,
         )
         assert str(fsig) == expected
+        assert str(fsig) is str(fsig)
         assert repr(fsig) == '<FSignature {}>'.format(expected)
 
+    def test__str__mutable_default(self):
+        """
+        Ensure that the string representation reflects changes to a mutable
+        default
+        """
+        default = []
+        fsig = FSignature([forge.arg('a', default=default)])
+        assert str(fsig) == '(a=[])'
+        default.append(1)
+        assert str(fsig) == '(a=[1])'
+
     @pytest.mark.parametrize(('bound',), [(True,), (False,)])
     def test_native(self, bound):
         """
@@ -1066,6 +1272,7 @@ class TestFSignature:
             [forge.arg('x', bound=bound, default=1)],
             return_annotation=int,
         )
+        assert fsig.native is fsig.native
         if bound:
             assert fsig.native == inspect.Signature(return_annotation=int)
             return
@@ -1094,6 +1301,7 @@ class TestFSignature:
         ], return_annotation=return_annotation)
         fsig = FSignature.from_native(sig)
         assert len(fsig.parameters) == 1
+        assert fsig.parameters is fsig.parameters
         assert fsig.parameters['a'] == FParameter(
             kind=POSITIONAL_OR_KEYWORD,
             name='a',